@@ -0,0 +1,329 @@
+"""
+Persistent pre-warmed headless Chrome shared across pytest invocations
+
+    python browser_daemon.py start [--url URL] [--idle-timeout SECONDS]
+    python browser_daemon.py status
+    python browser_daemon.py stop
+
+`start` keeps chromedriver and a headless Chrome (with the app loaded)
+running in the foreground and records how to reach them in
+.browser_daemon.json. conftest.py attaches a new WebDriver session to that
+browser when the daemon is healthy, so a test run skips Chrome startup.
+The browser has a single tab, so one session at a time holds the lease
+file in .browser_daemon.sessions/; other runs fall back to launching
+their own Chrome. The daemon exits after --idle-timeout seconds without
+use, but never while a lease is held. `status` reports how long
+attaching takes.
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import urllib.request
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+STATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".browser_daemon.json")
+SESSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".browser_daemon.sessions")
+LEASE_NAME = "lease"
+APP_URL = "http://localhost:5500/index.html"
+IDLE_TIMEOUT = 30 * 60
+CHECK_INTERVAL = 5
+# a lease this old belongs to a test run that died without releasing it
+LEASE_MAX_AGE = 2 * 60 * 60
+
+
+def read_state():
+    """Return the running daemon's state, or None"""
+    try:
+        with open(STATE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def touch_state():
+    """Mark the daemon as used so the idle timer restarts"""
+    try:
+        os.utime(STATE_FILE)
+    except OSError:
+        pass
+
+
+def chromedriver_ready(executor_url, timeout=1):
+    """Ask chromedriver's /status endpoint whether it accepts sessions"""
+    try:
+        with urllib.request.urlopen(f"{executor_url}/status", timeout=timeout) as r:
+            return json.load(r)["value"].get("ready", False)
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def browser_responding(debugger_address, timeout=1):
+    """
+    Ask Chrome's DevTools endpoint whether the browser is up
+    Never touches the page, so it cannot disturb a test (e.g. an open alert)
+    """
+    try:
+        with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=timeout) as r:
+            return "Browser" in json.load(r)
+    except (OSError, ValueError):
+        return False
+
+
+def is_healthy(state, timeout=1):
+    """Check that both chromedriver and the browser answer"""
+    return (chromedriver_ready(state["executor_url"], timeout)
+            and browser_responding(state["debugger_address"], timeout))
+
+
+def active_leases():
+    """Lease files of sessions currently attached to the browser"""
+    try:
+        names = os.listdir(SESSIONS_DIR)
+    except OSError:
+        return []
+    now = time.time()
+    leases = []
+    for name in names:
+        path = os.path.join(SESSIONS_DIR, name)
+        try:
+            if now - os.path.getmtime(path) < LEASE_MAX_AGE:
+                leases.append(path)
+        except OSError:
+            pass
+    return leases
+
+
+def acquire_lease():
+    """
+    Atomically claim the daemon's browser for this process
+    Returns False while another session holds a live lease
+    """
+    path = os.path.join(SESSIONS_DIR, LEASE_NAME)
+    os.makedirs(SESSIONS_DIR, exist_ok=True)
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if active_leases():
+                return False
+            # stale lease from a run that died; take it over
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+
+def release_lease():
+    """Give the browser back to the next session"""
+    try:
+        os.remove(os.path.join(SESSIONS_DIR, LEASE_NAME))
+    except OSError:
+        pass
+
+
+def attach_to_daemon():
+    """
+    Open a WebDriver session on the daemon's already-running browser
+    Returns None when no healthy daemon is available or another session
+    is using it
+    """
+    state = read_state()
+    if state is None or not is_healthy(state):
+        return None
+    if not acquire_lease():
+        return None
+
+    chrome_options = Options()
+    chrome_options.debugger_address = state["debugger_address"]
+    try:
+        driver = webdriver.Remote(command_executor=state["executor_url"], options=chrome_options)
+    except Exception:
+        release_lease()
+        return None
+    touch_state()
+    return driver
+
+
+def reset_tab(driver):
+    """Leave the shared tab as a fresh browser would: no alert, no storage, blank page"""
+    try:
+        driver.switch_to.alert.dismiss()
+    except WebDriverException:
+        pass
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        pass
+    try:
+        driver.delete_all_cookies()
+    except WebDriverException:
+        pass
+    try:
+        driver.get("about:blank")
+    except WebDriverException:
+        pass
+
+
+def release_from_daemon(driver):
+    """End an attached session; the daemon's browser keeps running"""
+    try:
+        reset_tab(driver)
+        driver.quit()
+    finally:
+        release_lease()
+        touch_state()
+
+
+def free_port():
+    """Pick an unused local TCP port"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def launch_browser(service, url, debug_port):
+    """Start headless Chrome through the daemon's chromedriver and load the app"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+
+    driver = webdriver.Remote(command_executor=service.service_url, options=chrome_options)
+    driver.get(url)
+    return driver
+
+
+def start(url, idle_timeout):
+    """Run the daemon until stopped or idle for idle_timeout seconds"""
+    state = read_state()
+    if state is not None and is_healthy(state):
+        print(f"Browser daemon already running (pid {state['pid']})")
+        return 1
+
+    service = Service(ChromeDriverManager().install())
+    driver = None
+    try:
+        service.start()
+        debug_port = free_port()
+        debugger_address = f"127.0.0.1:{debug_port}"
+        driver = launch_browser(service, url, debug_port)
+
+        with open(STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                "pid": os.getpid(),
+                "executor_url": service.service_url,
+                "debugger_address": debugger_address,
+                "app_url": url,
+            }, f, indent=2)
+
+        stopping = []
+        signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+        signal.signal(signal.SIGINT, lambda *_: stopping.append(True))
+        print(f"✓ Browser daemon ready (pid {os.getpid()}), idle timeout {idle_timeout}s")
+
+        while not stopping:
+            time.sleep(CHECK_INTERVAL)
+            if not chromedriver_ready(service.service_url):
+                print("chromedriver stopped responding, shutting down")
+                break
+            if not browser_responding(debugger_address):
+                if active_leases():
+                    # never quit the browser under an attached test session
+                    print("Browser not responding, waiting for attached sessions to finish")
+                    continue
+                print("Browser stopped responding, relaunching")
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                driver = launch_browser(service, url, debug_port)
+                continue
+            idle = time.time() - os.path.getmtime(STATE_FILE)
+            if idle > idle_timeout and not active_leases():
+                print(f"Idle for {idle:.0f}s, shutting down")
+                break
+    finally:
+        if os.path.exists(STATE_FILE):
+            os.remove(STATE_FILE)
+        try:
+            if driver is not None:
+                driver.quit()
+        finally:
+            service.stop()
+    return 0
+
+
+def stop():
+    """Ask a running daemon to shut down"""
+    state = read_state()
+    if state is None:
+        print("Browser daemon not running")
+        return 1
+    try:
+        os.kill(state["pid"], signal.SIGTERM)
+    except OSError:
+        # stale state from a daemon that died without cleaning up
+        os.remove(STATE_FILE)
+        print("Browser daemon not running (removed stale state)")
+        return 1
+    print(f"Stopping browser daemon (pid {state['pid']})")
+    return 0
+
+
+def status():
+    """Report whether a healthy daemon is available"""
+    state = read_state()
+    if state is None:
+        print("Browser daemon not running")
+        return 1
+    if not is_healthy(state):
+        print(f"Browser daemon (pid {state['pid']}) is not responding")
+        return 1
+    idle = time.time() - os.path.getmtime(STATE_FILE)
+    attached = bool(active_leases())
+    print(f"Browser daemon running (pid {state['pid']}), "
+          f"{state['app_url']} preloaded, idle {idle:.0f}s, "
+          f"{'in use by a test session' if attached else 'free'}")
+    if attached:
+        return 0
+
+    # Time what a test run pays to get a driver from the daemon
+    started = time.perf_counter()
+    driver = attach_to_daemon()
+    attach_ms = (time.perf_counter() - started) * 1000
+    if driver is None:
+        print("Attaching a session failed")
+        return 1
+    release_from_daemon(driver)
+    print(f"Attach took {attach_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-warmed browser for the test suite")
+    parser.add_argument("command", choices=["start", "stop", "status"])
+    parser.add_argument("--url", default=APP_URL, help=f"page to preload (default: {APP_URL})")
+    parser.add_argument("--idle-timeout", type=int, default=IDLE_TIMEOUT,
+                        help=f"seconds without use before exiting (default: {IDLE_TIMEOUT})")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        sys.exit(start(args.url, args.idle_timeout))
+    sys.exit(stop() if args.command == "stop" else status())
@@ -1,15 +1,33 @@
+import csv
+import json
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+from browser_daemon import attach_to_daemon, release_from_daemon
+from sharding import (DURATIONS_FILE, RESULTS_FILE, RESULT_FIELDS,
+                      parse_shard, shard_filename, split_into_shards)
+
+# perf_budget marker enforcement and headroom report
+pytest_plugins = ["perf_budget"]
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """
     Pytest fixture to initialize and teardown WebDriver
     Scope: function - creates new driver for each test
+    Attaches to the browser daemon (browser_daemon.py) when one is running
     """
+    if not request.config.getoption("--no-daemon"):
+        driver = attach_to_daemon()
+        if driver is not None:
+            driver.implicitly_wait(10)
+            yield driver
+            release_from_daemon(driver)
+            return
+
     # Chrome options
     chrome_options = Options()
     # Uncomment the line below to run in headless mode
@@ -45,6 +63,28 @@ def test_setup():
     print("\n========== TEST SUITE COMPLETED ==========")
 
 
+# Rows for test_results.csv, collected across the whole session
+test_results_key = pytest.StashKey[list]()
+
+
+@pytest.fixture(scope="session")
+def log_test_result(request):
+    """Return a helper that records one row for test_results.csv"""
+    test_results = request.config.stash.setdefault(test_results_key, [])
+
+    def log(test_id, description, test_type, expected, actual, status, remarks=""):
+        test_results.append({
+            'Test ID': test_id,
+            'Description': description,
+            'Type': test_type,
+            'Expected Result': expected,
+            'Actual Result': actual,
+            'Status': status,
+            'Remarks': remarks
+        })
+    return log
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest markers"""
@@ -59,4 +99,114 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "security: marks tests as security tests"
-    )
\ No newline at end of file
+    )
+    config.addinivalue_line(
+        "markers",
+        "perf_budget(**budgets_ms, measures=None): fail the test if page "
+        "timings exceed the given budgets in milliseconds"
+    )
+
+
+# ============ SHARDING ============
+
+# Per-test durations measured in this run
+test_durations = {}
+# Set when --shard=I/N leaves this shard with no tests (N > number of tests)
+empty_shard_key = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser):
+    """Add sharding, duration-history and browser daemon options"""
+    group = parser.getgroup("sharding")
+    group.addoption(
+        "--shard", default=None, metavar="I/N",
+        help="run only shard I of N (1-based), balanced by recorded durations"
+    )
+    group.addoption(
+        "--durations-path", default=DURATIONS_FILE,
+        help=f"per-test duration history (default: {DURATIONS_FILE})"
+    )
+    group.addoption(
+        "--store-durations", action="store_true", default=False,
+        help="record this run's per-test durations into the history"
+    )
+    parser.getgroup("browser daemon").addoption(
+        "--no-daemon", action="store_true", default=False,
+        help="always launch a fresh browser instead of attaching to browser_daemon.py"
+    )
+
+
+def selected_shard(config):
+    """Return (index, total) for --shard, or None when not sharded"""
+    shard = config.getoption("--shard")
+    if not shard:
+        return None
+    try:
+        return parse_shard(shard)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+
+def load_durations(path):
+    """Load recorded durations in seconds keyed by node id"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect every test outside the requested shard"""
+    shard = selected_shard(config)
+    if shard is None:
+        return
+    index, total = shard
+    durations = load_durations(config.getoption("--durations-path"))
+    selected = set(split_into_shards([i.nodeid for i in items], durations, total)[index - 1])
+    config.stash[empty_shard_key] = bool(items) and not selected
+
+    deselected = [i for i in items if i.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [i for i in items if i.nodeid in selected]
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate setup + call + teardown time per test"""
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Save test results (and optionally durations) after all tests complete"""
+    config = session.config
+    shard = selected_shard(config)
+
+    if exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED and config.stash.get(empty_shard_key, False):
+        # an empty shard is expected when N exceeds the number of tests;
+        # don't fail the CI job for it
+        session.exitstatus = pytest.ExitCode.OK
+
+    def output_path(filename):
+        # shards write their own files so machines never clobber each other
+        return filename if shard is None else shard_filename(filename, *shard)
+
+    if config.getoption("--store-durations"):
+        out_path = output_path(config.getoption("--durations-path"))
+        durations = load_durations(out_path)
+        durations.update(test_durations)
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+
+    test_results = config.stash.get(test_results_key, [])
+    if test_results:
+        filename = output_path(RESULTS_FILE)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(test_results)
+        print(f"\n✓ Test results saved to {filename}")
+        print(f"Total tests: {len(test_results)}")
+        passed = sum(1 for r in test_results if r['Status'] == 'PASS')
+        failed = sum(1 for r in test_results if r['Status'] == 'FAIL')
+        print(f"Passed: {passed}, Failed: {failed}")
\ No newline at end of file
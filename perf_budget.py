@@ -0,0 +1,114 @@
+"""
+Plugin behind the perf_budget marker (registered in conftest.py)
+
+    @pytest.mark.perf_budget(dom_interactive=1000, measures={"renderTodos": 50})
+
+After a test body passes, the page's Navigation Timing, paint timings and
+performance.measure spans are read from the test's driver and compared with
+each budget in milliseconds; the test fails if any budget is exceeded or the
+metric was never recorded. A terminal summary lists the headroom per budget.
+"""
+import pytest
+
+# Navigation Timing, paint timings and performance.measure spans, in ms
+# relative to navigation start (spans report their longest duration)
+COLLECT_TIMINGS_JS = """
+const timings = {};
+const nav = performance.getEntriesByType('navigation')[0];
+if (nav) {
+    timings.ttfb = nav.responseStart;
+    timings.response_end = nav.responseEnd;
+    timings.dom_interactive = nav.domInteractive;
+    timings.dom_content_loaded = nav.domContentLoadedEventEnd;
+    timings.load = nav.loadEventEnd;
+}
+performance.getEntriesByType('paint').forEach((e) => {
+    timings[e.name.replace(/-/g, '_')] = e.startTime;
+});
+const measures = {};
+performance.getEntriesByType('measure').forEach((e) => {
+    measures[e.name] = Math.max(measures[e.name] || 0, e.duration);
+});
+return { timings: timings, measures: measures };
+"""
+
+
+def check_perf_budget(driver, marker):
+    """
+    Compare collected page timings against a perf_budget marker
+    Returns one (metric, actual_ms, budget_ms) row per budget;
+    actual_ms is None when the page never recorded that metric
+    """
+    collected = driver.execute_script(COLLECT_TIMINGS_JS)
+    budgets = dict(marker.kwargs)
+    measure_budgets = budgets.pop("measures", None) or {}
+
+    rows = []
+    for metric, budget in budgets.items():
+        rows.append((metric, collected["timings"].get(metric), budget))
+    for name, budget in measure_budgets.items():
+        rows.append((f"measure:{name}", collected["measures"].get(name), budget))
+    return rows
+
+
+def format_budget_row(metric, actual, budget):
+    """Format one budget row with its headroom"""
+    if actual is None:
+        return f"{metric}: not recorded (budget {budget:.0f} ms)"
+    headroom = budget - actual
+    # a 0 ms budget has no meaningful relative headroom
+    relative = f", {headroom / budget:+.0%}" if budget else ""
+    return (f"{metric}: {actual:.1f} ms / {budget:.0f} ms "
+            f"(headroom {headroom:+.1f} ms{relative})")
+
+
+@pytest.fixture
+def perf_budget_rows(request, driver):
+    """
+    Evaluate the test's perf_budget marker on demand, so a test can log its
+    result before the marker check runs; returns a callable
+    """
+    marker = request.node.get_closest_marker("perf_budget")
+    if marker is None:
+        pytest.fail("perf_budget_rows requires a perf_budget marker", pytrace=False)
+    return lambda: check_perf_budget(driver, marker)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item):
+    """Enforce perf_budget markers once the test body has passed"""
+    marker = item.get_closest_marker("perf_budget")
+    if marker is None:
+        return
+    driver = item.funcargs.get("driver")
+    if driver is None:
+        pytest.fail("perf_budget marker requires the driver fixture", pytrace=False)
+
+    rows = check_perf_budget(driver, marker)
+    item.user_properties.append(("perf_budget", rows))
+
+    over = [r for r in rows if r[1] is None or r[1] > r[2]]
+    if over:
+        pytest.fail(
+            "Performance budget exceeded:\n" +
+            "\n".join(format_budget_row(*r) for r in over),
+            pytrace=False
+        )
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print headroom against each performance budget"""
+    lines = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            for name, rows in report.user_properties:
+                if name != "perf_budget":
+                    continue
+                lines.append(report.nodeid)
+                lines.extend(f"    {format_budget_row(*r)}" for r in rows)
+    if lines:
+        terminalreporter.write_sep("=", "performance budgets")
+        for line in lines:
+            terminalreporter.write_line(line)
@@ -1,12 +1,44 @@
 let todos = [];
 let currentFilter = 'all';
 let todoId = 1;
+let renderCount = 0;
+let renderScheduled = false;
+let batchDepth = 0;
+let undoLog = null;
+let currentSort = 'none';
+let groupByStatus = false;
+let importInProgress = false;
+let lastTransfer = null;
+
+const TRANSFER_CHUNK_SIZE = 1000;
+// no single CSV field or JSON item may buffer more than this while importing
+const MAX_IMPORT_ITEM_LENGTH = 10000;
+// the created index compares ISO strings, which only sort correctly for
+// four-digit years
+const MIN_CREATED_AT = Date.parse('0000-01-01T00:00:00.000Z');
+const MAX_CREATED_AT = Date.parse('9999-12-31T23:59:59.999Z');
+const CSV_COLUMNS = ['text', 'completed', 'createdAt'];
+
+const collator = new Intl.Collator(undefined, { sensitivity: 'base', numeric: true });
+const sortComparators = {
+  created: (a, b) => (a.createdAt < b.createdAt ? 1 : a.createdAt > b.createdAt ? -1 : b.id - a.id),
+  alpha: (a, b) => collator.compare(a.text, b.text) || a.id - b.id,
+  status: (a, b) => a.completed - b.completed || a.id - b.id,
+};
+let sortIndexes = { created: [], alpha: [], status: [] };
 
 const todoInput = document.getElementById('todoInput');
 const addBtn = document.getElementById('addBtn');
 const todoList = document.getElementById('todoList');
 const filterBtns = document.querySelectorAll('.filter-btn');
 const clearCompletedBtn = document.getElementById('clearCompleted');
+const sortSelect = document.getElementById('sortSelect');
+const groupToggle = document.getElementById('groupByStatus');
+const importFile = document.getElementById('importFile');
+const exportJsonBtn = document.getElementById('exportJson');
+const exportCsvBtn = document.getElementById('exportCsv');
+const transferProgress = document.getElementById('transferProgress');
+const transferStatus = document.getElementById('transferStatus');
 
 addBtn.addEventListener('click', addTodo);
 todoInput.addEventListener('keypress', (e) => {
@@ -18,12 +50,38 @@ filterBtns.forEach((btn) => {
     filterBtns.forEach((b) => b.classList.remove('active'));
     btn.classList.add('active');
     currentFilter = btn.dataset.filter;
-    renderTodos();
+    scheduleRender();
   });
 });
 
 clearCompletedBtn.addEventListener('click', clearCompleted);
 
+sortSelect.addEventListener('change', () => {
+  currentSort = sortSelect.value;
+  scheduleRender();
+});
+
+groupToggle.addEventListener('change', () => {
+  groupByStatus = groupToggle.checked;
+  scheduleRender();
+});
+
+importFile.addEventListener('change', () => {
+  const file = importFile.files[0];
+  if (!file) return;
+  importTodos(file)
+    .catch((err) => {
+      transferProgress.hidden = true;
+      transferStatus.textContent = `Import failed: ${err.message} (no tasks were imported)`;
+    })
+    .finally(() => {
+      importFile.value = '';
+    });
+});
+
+exportJsonBtn.addEventListener('click', () => downloadTodos('json'));
+exportCsvBtn.addEventListener('click', () => downloadTodos('csv'));
+
 function addTodo() {
   const text = todoInput.value.trim();
   if (text === '') {
@@ -39,62 +97,527 @@ function addTodo() {
   };
 
   todos.push(todo);
+  indexInsert(todo);
   todoInput.value = '';
-  renderTodos();
+  scheduleRender();
 }
 
 function toggleTodo(id) {
   const todo = todos.find((t) => t.id === id);
   if (todo) {
+    indexRemove(todo, 'status');
+    recordCompleted(todo);
     todo.completed = !todo.completed;
-    renderTodos();
+    indexInsert(todo, 'status');
+    scheduleRender();
   }
 }
 
 function deleteTodo(id) {
+  const todo = todos.find((t) => t.id === id);
+  if (todo) indexRemove(todo);
   todos = todos.filter((t) => t.id !== id);
-  renderTodos();
+  scheduleRender();
 }
 
 function clearCompleted() {
   todos = todos.filter((t) => !t.completed);
-  renderTodos();
+  Object.keys(sortIndexes).forEach((key) => {
+    sortIndexes[key] = sortIndexes[key].filter((t) => !t.completed);
+  });
+  scheduleRender();
 }
 
-function renderTodos() {
-  let filteredTodos = todos;
+// batch mutations: the list is rendered once after the outermost batch ends,
+// and restored to its previous state if the callback throws. Rollback uses an
+// undo log rather than a copy: additions only append and deletions replace
+// `todos` with a filtered copy, so the original array truncated to its old
+// length is the old list; status changes are recorded as they happen.
+function batch(fn) {
+  const outermost = undoLog === null;
+  if (outermost) {
+    undoLog = { todos, length: todos.length, todoId, completed: new Map() };
+  }
+  batchDepth++;
+  try {
+    fn();
+  } catch (err) {
+    if (outermost) rollback(undoLog);
+    throw err;
+  } finally {
+    batchDepth--;
+    if (outermost) undoLog = null;
+    scheduleRender();
+  }
+}
+
+function recordCompleted(todo) {
+  if (undoLog && !undoLog.completed.has(todo)) undoLog.completed.set(todo, todo.completed);
+}
+
+function rollback(log) {
+  todos = log.todos;
+  todos.length = log.length;
+  todoId = log.todoId;
+  log.completed.forEach((completed, todo) => {
+    todo.completed = completed;
+  });
+  rebuildIndexes();
+}
+
+function addTodos(items) {
+  batch(() => insertTodos(items));
+}
+
+// items are either task texts or { text, completed, createdAt } records;
+// blank texts are skipped. Does not schedule a render.
+function insertTodos(items) {
+  const added = [];
+  items.forEach((item) => {
+    const record = typeof item === 'object' && item !== null ? item : { text: item };
+    const text = String(record.text ?? '').trim();
+    if (text === '') return;
+    const todo = {
+      id: todoId++,
+      text: text,
+      completed: record.completed === true || record.completed === 'true' || record.completed === '1',
+      createdAt: normalizeCreatedAt(record.createdAt),
+    };
+    todos.push(todo);
+    added.push(todo);
+  });
+  indexMerge(added);
+  return added;
+}
+
+function toggleAll(completed) {
+  const target = completed === undefined ? todos.some((t) => !t.completed) : completed;
+  batch(() => {
+    todos.forEach((t) => {
+      if (t.completed === target) return;
+      recordCompleted(t);
+      t.completed = target;
+    });
+    // every item now shares one status, so the status order is just id order
+    sortIndexes.status = todos.slice();
+  });
+}
+
+// imported dates may be epoch milliseconds or arbitrary strings; the created
+// index compares ISO strings, so anything else would break its ordering
+function normalizeCreatedAt(value) {
+  const text = String(value);
+  // only 10+ digits is a plausible epoch-ms timestamp; '2024' is a year
+  const time = /^\d{10,}$/.test(text) ? Number(text) : Date.parse(text);
+  if (Number.isNaN(time)) return new Date().toISOString();
+  return new Date(Math.min(Math.max(time, MIN_CREATED_AT), MAX_CREATED_AT)).toISOString();
+}
 
-  if (currentFilter === 'active') {
-    filteredTodos = todos.filter((t) => !t.completed);
-  } else if (currentFilter === 'completed') {
-    filteredTodos = todos.filter((t) => t.completed);
+// sorted indexes hold references into `todos` and are updated per mutation,
+// so a sorted view never re-sorts the whole list
+function indexPosition(index, todo, compare, lo = 0) {
+  let hi = index.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (compare(index[mid], todo) < 0) lo = mid + 1;
+    else hi = mid;
   }
+  return lo;
+}
+
+function indexInsert(todo, only) {
+  const keys = only ? [only] : Object.keys(sortIndexes);
+  keys.forEach((key) => {
+    const index = sortIndexes[key];
+    index.splice(indexPosition(index, todo, sortComparators[key]), 0, todo);
+  });
+}
+
+function indexRemove(todo, only) {
+  const keys = only ? [only] : Object.keys(sortIndexes);
+  keys.forEach((key) => {
+    const index = sortIndexes[key];
+    const pos = indexPosition(index, todo, sortComparators[key]);
+    if (index[pos] === todo) index.splice(pos, 1);
+  });
+}
+
+// merge a run of new items in one pass instead of splicing them one by one
+function indexMerge(added) {
+  Object.keys(sortIndexes).forEach((key) => {
+    const compare = sortComparators[key];
+    const index = sortIndexes[key];
+    const incoming = added.slice().sort(compare);
+    const merged = new Array(index.length + incoming.length);
+    let i = 0;
+    let k = 0;
+    // binary-search each insertion point so comparisons stay O(k log n)
+    incoming.forEach((todo) => {
+      const pos = indexPosition(index, todo, compare, i);
+      while (i < pos) merged[k++] = index[i++];
+      merged[k++] = todo;
+    });
+    while (i < index.length) merged[k++] = index[i++];
+    sortIndexes[key] = merged;
+  });
+}
+
+function rebuildIndexes() {
+  Object.keys(sortIndexes).forEach((key) => {
+    sortIndexes[key] = todos.slice().sort(sortComparators[key]);
+  });
+}
+
+function getVisibleTodos() {
+  const source = currentSort === 'none' ? todos : sortIndexes[currentSort];
+
+  if (currentFilter === 'active') return source.filter((t) => !t.completed);
+  if (currentFilter === 'completed') return source.filter((t) => t.completed);
+  return source;
+}
+
+// coalesce every mutation made within a frame into a single render
+function scheduleRender() {
+  if (batchDepth > 0 || renderScheduled) return;
+  renderScheduled = true;
+  requestAnimationFrame(() => {
+    renderScheduled = false;
+    renderTodos();
+  });
+}
+
+function renderTodos() {
+  renderCount++;
+  const start = performance.now();
+  const filteredTodos = getVisibleTodos();
 
   todoList.innerHTML = '';
 
   if (filteredTodos.length === 0) {
     todoList.innerHTML = '<div class="empty-state">No tasks to display</div>';
+  } else if (groupByStatus) {
+    const active = filteredTodos.filter((t) => !t.completed);
+    const completed = filteredTodos.filter((t) => t.completed);
+    if (active.length > 0) renderGroup('Active', active);
+    if (completed.length > 0) renderGroup('Completed', completed);
   } else {
-    filteredTodos.forEach((todo) => {
-      const li = document.createElement('li');
-      li.className = `todo-item ${todo.completed ? 'completed' : ''}`;
-      li.dataset.id = todo.id;
-
-      li.innerHTML = `
-        <input type="checkbox" class="todo-checkbox" ${todo.completed ? 'checked' : ''}>
-        <span class="todo-text"></span>
-        <button class="delete-btn">Delete</button>
-      `;
-
-      li.querySelector('.todo-text').textContent = todo.text;
-      li.querySelector('.todo-checkbox').addEventListener('change', () => toggleTodo(todo.id));
-      li.querySelector('.delete-btn').addEventListener('click', () => deleteTodo(todo.id));
-
-      todoList.appendChild(li);
-    });
+    filteredTodos.forEach(renderTodoItem);
   }
 
   updateStats();
+  // keep only the latest span so entries do not pile up while the page is open
+  performance.clearMeasures('renderTodos');
+  performance.measure('renderTodos', { start, end: performance.now() });
+}
+
+function renderGroup(title, items) {
+  const header = document.createElement('li');
+  header.className = 'group-header';
+  header.textContent = `${title} (${items.length})`;
+  todoList.appendChild(header);
+  items.forEach(renderTodoItem);
+}
+
+function renderTodoItem(todo) {
+  const li = document.createElement('li');
+  li.className = `todo-item ${todo.completed ? 'completed' : ''}`;
+  li.dataset.id = todo.id;
+
+  li.innerHTML = `
+    <input type="checkbox" class="todo-checkbox" ${todo.completed ? 'checked' : ''}>
+    <span class="todo-text"></span>
+    <button class="delete-btn">Delete</button>
+  `;
+
+  li.querySelector('.todo-text').textContent = todo.text;
+  li.querySelector('.todo-checkbox').addEventListener('change', () => toggleTodo(todo.id));
+  li.querySelector('.delete-btn').addEventListener('click', () => deleteTodo(todo.id));
+
+  todoList.appendChild(li);
+}
+
+// ---------- bulk import / export ----------
+
+const yieldToEventLoop = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+// streaming CSV parser: chunks may split rows and quoted fields anywhere
+function createCsvParser(onRow) {
+  let field = '';
+  let row = [];
+  let inQuotes = false;
+  let quotePending = false;
+
+  function push(chunk) {
+    for (let i = 0; i < chunk.length; i++) {
+      const c = chunk[i];
+      if (inQuotes) {
+        if (quotePending) {
+          quotePending = false;
+          if (c === '"') {
+            field += '"';
+            continue;
+          }
+          inQuotes = false;
+        } else {
+          if (c === '"') quotePending = true;
+          else field += c;
+          if (field.length > MAX_IMPORT_ITEM_LENGTH) throw new Error('CSV field too long or unterminated quote');
+          continue;
+        }
+      }
+      if (c === '"') {
+        inQuotes = true;
+      } else if (c === ',') {
+        row.push(field);
+        field = '';
+      } else if (c === '\n') {
+        row.push(field);
+        onRow(row);
+        row = [];
+        field = '';
+      } else if (c !== '\r') {
+        field += c;
+        if (field.length > MAX_IMPORT_ITEM_LENGTH) throw new Error('CSV field too long');
+      }
+    }
+  }
+
+  function end() {
+    if (inQuotes && !quotePending) throw new Error('Unterminated quoted field in CSV');
+    if (field !== '' || row.length > 0) {
+      row.push(field);
+      onRow(row);
+    }
+  }
+
+  return { push, end };
+}
+
+// streaming parser for a top-level JSON array of task objects or strings
+function createJsonArrayParser(onItem) {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  let started = false;
+  // position inside the array: 'start' after '[', 'item' after an item,
+  // 'comma' after a comma; items must be separated by exactly one comma
+  let state = 'start';
+  let pending = '';
+
+  function push(chunk) {
+    // an item may continue from the previous chunk
+    let start = depth >= 2 || (depth === 1 && inString) ? 0 : -1;
+
+    function emit(end) {
+      onItem(JSON.parse(pending + chunk.slice(start, end)));
+      pending = '';
+      start = -1;
+      state = 'item';
+    }
+
+    function beginItem() {
+      if (state === 'item') throw new Error("Expected ',' between JSON array items");
+    }
+
+    for (let i = 0; i < chunk.length; i++) {
+      const c = chunk[i];
+      if (inString) {
+        if (escaped) escaped = false;
+        else if (c === '\\') escaped = true;
+        else if (c === '"') {
+          inString = false;
+          if (depth === 1) emit(i + 1);
+        }
+        continue;
+      }
+      if (c === ' ' || c === '\n' || c === '\r' || c === '\t') continue;
+      if (depth === 0) {
+        if (started || c !== '[') throw new Error('Expected a JSON array of tasks');
+        started = true;
+        depth = 1;
+      } else if (c === '"') {
+        inString = true;
+        if (depth === 1) {
+          beginItem();
+          start = i;
+        }
+      } else if (c === '{' || c === '[') {
+        if (depth === 1) beginItem();
+        depth++;
+        if (depth === 2) start = i;
+      } else if (c === '}' || c === ']') {
+        if (depth === 1 && state === 'comma') throw new Error('Trailing comma in JSON array');
+        depth--;
+        if (depth === 1) emit(i + 1);
+      } else if (depth === 1 && c === ',') {
+        if (state !== 'item') throw new Error('Unexpected comma in JSON array');
+        state = 'comma';
+      } else if (depth === 1) {
+        throw new Error('JSON array items must be task objects or strings');
+      }
+    }
+    if (start !== -1) {
+      pending += chunk.slice(start);
+      if (pending.length > MAX_IMPORT_ITEM_LENGTH) throw new Error('JSON array item too long');
+    }
+  }
+
+  function end() {
+    if (!started || depth !== 0 || inString) throw new Error('Unexpected end of JSON');
+  }
+
+  return { push, end };
+}
+
+function reportProgress(label, done, total) {
+  const percent = total > 0 ? Math.min(100, Math.round((done / total) * 100)) : 100;
+  transferProgress.hidden = false;
+  transferProgress.value = percent;
+  transferStatus.textContent = `${label}... ${percent}%`;
+}
+
+// append freshly imported items without redrawing the whole list; only
+// possible while the view shows insertion order
+function appendToView(added) {
+  if (currentSort !== 'none' || groupByStatus) return false;
+  const visible = added.filter((todo) => {
+    if (currentFilter === 'active') return !todo.completed;
+    if (currentFilter === 'completed') return todo.completed;
+    return true;
+  });
+  if (visible.length === 0) return true;
+  const empty = todoList.querySelector('.empty-state');
+  if (empty) empty.remove();
+  visible.forEach(renderTodoItem);
+  return true;
+}
+
+async function importTodos(file) {
+  if (importInProgress) throw new Error('An import is already running');
+  importInProgress = true;
+  importFile.disabled = true;
+
+  const format = file.name.toLowerCase().endsWith('.csv') ? 'csv' : 'json';
+  const started = performance.now();
+  let pending = [];
+  let bytesRead = 0; // raw file bytes, to compare with file.size
+  let imported = 0;
+  let needsRender = false;
+  let columns = null;
+  // id range of each inserted chunk, so a failed import can be undone even
+  // if tasks were added by hand while it ran
+  const importedRanges = [];
+
+  const parser =
+    format === 'csv'
+      ? createCsvParser((row) => {
+          if (!columns) {
+            columns = row.map((name) => name.trim());
+            if (!columns.includes('text')) throw new Error('CSV header must include a text column');
+            return;
+          }
+          const record = {};
+          columns.forEach((name, i) => {
+            record[name] = row[i];
+          });
+          pending.push(record);
+        })
+      : createJsonArrayParser((item) => pending.push(item));
+
+  // only one decoded chunk worth of rows is held at a time
+  async function flush() {
+    while (pending.length > 0) {
+      const added = insertTodos(pending.splice(0, TRANSFER_CHUNK_SIZE));
+      if (added.length > 0) importedRanges.push([added[0].id, added[added.length - 1].id]);
+      imported += added.length;
+      if (!appendToView(added)) needsRender = true;
+      updateStats();
+      reportProgress('Importing', bytesRead, file.size);
+      await yieldToEventLoop();
+    }
+  }
+
+  try {
+    const reader = file.stream().getReader();
+    const decoder = new TextDecoder();
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      bytesRead += value.byteLength;
+      parser.push(decoder.decode(value, { stream: true }));
+      await flush();
+    }
+    parser.push(decoder.decode());
+    parser.end();
+    await flush();
+  } catch (err) {
+    // all or nothing: drop the chunks inserted before the error
+    const wasImported = (t) => importedRanges.some(([first, last]) => t.id >= first && t.id <= last);
+    todos = todos.filter((t) => !wasImported(t));
+    rebuildIndexes();
+    needsRender = true;
+    throw err;
+  } finally {
+    importInProgress = false;
+    importFile.disabled = false;
+    if (needsRender) scheduleRender();
+  }
+
+  const ms = performance.now() - started;
+  performance.clearMeasures('importTodos');
+  performance.measure('importTodos', { start: started, duration: ms });
+  lastTransfer = { type: 'import', format, rows: imported, ms };
+  transferProgress.value = 100;
+  transferStatus.textContent = `Imported ${imported} tasks`;
+  return lastTransfer;
+}
+
+function csvField(value) {
+  const text = String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+// serialize in chunks into Blob parts so the encoded file never sits in
+// one JS string
+async function exportTodos(format) {
+  const started = performance.now();
+  const snapshot = todos.slice();
+  const parts = [];
+
+  parts.push(format === 'csv' ? `${CSV_COLUMNS.join(',')}\n` : '[');
+  for (let i = 0; i < snapshot.length; i += TRANSFER_CHUNK_SIZE) {
+    const chunk = snapshot.slice(i, i + TRANSFER_CHUNK_SIZE);
+    let text;
+    if (format === 'csv') {
+      text = chunk.map((t) => CSV_COLUMNS.map((name) => csvField(t[name])).join(',') + '\n').join('');
+    } else {
+      text = (i > 0 ? ',' : '') + chunk
+        .map((t) => JSON.stringify({ text: t.text, completed: t.completed, createdAt: t.createdAt }))
+        .join(',');
+    }
+    parts.push(new Blob([text]));
+    reportProgress('Exporting', i + chunk.length, snapshot.length);
+    await yieldToEventLoop();
+  }
+  if (format !== 'csv') parts.push(']');
+
+  const blob = new Blob(parts, { type: format === 'csv' ? 'text/csv' : 'application/json' });
+  performance.clearMeasures('exportTodos');
+  performance.measure('exportTodos', { start: started, end: performance.now() });
+  lastTransfer = { type: 'export', format, rows: snapshot.length, ms: performance.now() - started };
+  transferProgress.value = 100;
+  transferStatus.textContent = `Exported ${snapshot.length} tasks`;
+  return blob;
+}
+
+async function downloadTodos(format) {
+  const blob = await exportTodos(format);
+  const url = URL.createObjectURL(blob);
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = `todos.${format}`;
+  link.click();
+  setTimeout(() => URL.revokeObjectURL(url), 0);
 }
 
 function updateStats() {
@@ -0,0 +1,127 @@
+"""
+Helpers for splitting the suite across machines (pytest --shard=I/N)
+
+    python sharding.py merge N [DIRECTORY] [--durations-path PATH]
+
+merge combines test_results.shard-*-of-N.csv into test_results.csv and,
+when present, .test_durations.shard-*-of-N.json into .test_durations.json
+(or the shard files of PATH into PATH, matching pytest --durations-path).
+Only files from an N-shard run are read, so leftovers from runs with a
+different shard count are ignored.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+
+DURATIONS_FILE = ".test_durations.json"
+RESULTS_FILE = "test_results.csv"
+RESULT_FIELDS = ['Test ID', 'Description', 'Type', 'Expected Result',
+                 'Actual Result', 'Status', 'Remarks']
+
+
+def parse_shard(value):
+    """Parse 'i/n' into (i, n), validating 1 <= i <= n"""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"--shard expects I/N, got {value!r}")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"--shard {value}: expected 1 <= I <= N")
+    return index, total
+
+
+def split_into_shards(nodeids, durations, total):
+    """
+    Assign node ids to shards, longest test first, each to the shard with
+    the least total time so far. Tests without history are weighted with
+    the average recorded duration; with no history at all every weight is
+    equal and the split is a deterministic round-robin over node ids.
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    default = sum(known) / len(known) if known else 1.0
+    weights = {n: durations.get(n, default) for n in nodeids}
+
+    shards = [[] for _ in range(total)]
+    loads = [0.0] * total
+    for nodeid in sorted(nodeids, key=lambda n: (-weights[n], n)):
+        target = min(range(total), key=lambda i: (loads[i], i))
+        shards[target].append(nodeid)
+        loads[target] += weights[nodeid]
+    return shards
+
+
+def shard_filename(filename, index, total):
+    """Per-shard variant of filename, e.g. test_results.shard-1-of-3.csv"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.shard-{index}-of-{total}{ext}"
+
+
+def shard_files(directory, filename, total):
+    """List the per-shard variants of filename from an N-shard run"""
+    pattern = shard_filename(glob.escape(filename), "*", total)
+    return sorted(glob.glob(os.path.join(directory, pattern)))
+
+
+def merge_results(directory, total):
+    """Merge shard result CSVs into one file ordered by Test ID"""
+    rows = []
+    for path in shard_files(directory, RESULTS_FILE, total):
+        with open(path, newline='', encoding='utf-8') as f:
+            rows.extend(csv.DictReader(f))
+    if not rows:
+        return None
+
+    rows.sort(key=lambda r: r['Test ID'])
+    out_path = os.path.join(directory, RESULTS_FILE)
+    with open(out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return out_path, rows
+
+
+def merge_durations(directory, total, filename=DURATIONS_FILE):
+    """Fold shard duration histories into the main history file"""
+    paths = shard_files(directory, filename, total)
+    if not paths:
+        return None
+
+    out_path = os.path.join(directory, filename)
+    durations = {}
+    for path in [out_path] + paths:
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                durations.update(json.load(f))
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    return out_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge per-shard test outputs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    merge = subparsers.add_parser("merge", help="merge outputs of an N-shard run")
+    merge.add_argument("shards", type=int, help="number of shards (N in --shard=I/N)")
+    merge.add_argument("directory", nargs="?", default=".")
+    merge.add_argument("--durations-path", default=DURATIONS_FILE,
+                       help=f"history passed to pytest --durations-path (default: {DURATIONS_FILE})")
+    args = parser.parse_args()
+
+    merged = merge_results(args.directory, args.shards)
+    if merged is not None:
+        out_path, rows = merged
+        passed = sum(1 for r in rows if r['Status'] == 'PASS')
+        failed = sum(1 for r in rows if r['Status'] == 'FAIL')
+        print(f"✓ Merged {len(rows)} results into {out_path}")
+        print(f"Passed: {passed}, Failed: {failed}")
+
+    durations_path = merge_durations(args.directory, args.shards, args.durations_path)
+    if durations_path:
+        print(f"✓ Merged durations into {durations_path}")
+
+    if merged is None and durations_path is None:
+        print(f"No result or duration files found for a {args.shards}-shard run")
+        sys.exit(1)
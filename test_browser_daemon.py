@@ -0,0 +1,139 @@
+import json
+import os
+import time
+
+import pytest
+import browser_daemon
+from browser_daemon import (LEASE_MAX_AGE, active_leases, attach_to_daemon, free_port,
+                            is_healthy, read_state, release_from_daemon)
+
+
+class StubDriver:
+    """Records the WebDriver calls made while releasing a session"""
+
+    session_id = "stub-session"
+
+    def __init__(self, calls):
+        self.calls = calls
+        self.switch_to = self
+
+    @property
+    def alert(self):
+        return self
+
+    def dismiss(self):
+        self.calls.append("dismiss alert")
+
+    def execute_script(self, script):
+        self.calls.append("clear storage")
+
+    def delete_all_cookies(self):
+        self.calls.append("delete cookies")
+
+    def get(self, url):
+        self.calls.append(f"get {url}")
+
+    def quit(self):
+        self.calls.append("quit")
+
+
+@pytest.fixture
+def daemon_files(tmp_path, monkeypatch):
+    """Point the daemon's state and lease files at a temporary directory"""
+    monkeypatch.setattr(browser_daemon, "STATE_FILE", str(tmp_path / "state.json"))
+    monkeypatch.setattr(browser_daemon, "SESSIONS_DIR", str(tmp_path / "sessions"))
+    return tmp_path
+
+
+@pytest.fixture
+def running_daemon(daemon_files, monkeypatch):
+    """A daemon whose state file exists and which answers health checks"""
+    (daemon_files / "state.json").write_text(json.dumps({
+        "pid": os.getpid(),
+        "executor_url": "http://127.0.0.1:1",
+        "debugger_address": "127.0.0.1:2",
+        "app_url": browser_daemon.APP_URL,
+    }))
+    monkeypatch.setattr(browser_daemon, "is_healthy", lambda state: True)
+    calls = []
+
+    def remote(command_executor, options):
+        calls.append("attach")
+        return StubDriver(calls)
+
+    monkeypatch.setattr(browser_daemon.webdriver, "Remote", remote)
+    return calls
+
+
+class TestBrowserDaemon:
+    """Unit tests for browser_daemon.py that need no browser"""
+
+    def test_active_leases_expire_by_age(self, daemon_files):
+        """Leases older than LEASE_MAX_AGE belong to dead runs and are ignored"""
+        sessions = daemon_files / "sessions"
+        sessions.mkdir()
+        (sessions / "fresh").write_text("")
+        (sessions / "stale").write_text("")
+        old = time.time() - LEASE_MAX_AGE - 60
+        os.utime(sessions / "stale", (old, old))
+        assert active_leases() == [str(sessions / "fresh")]
+
+    def test_active_leases_without_sessions_dir(self, daemon_files):
+        """No lease directory means no attached sessions"""
+        assert active_leases() == []
+
+    def test_read_state_missing_or_malformed(self, daemon_files):
+        """A missing or half-written state file reads as no daemon"""
+        assert read_state() is None
+        (daemon_files / "state.json").write_text("{\"pid\": ")
+        assert read_state() is None
+
+    def test_is_healthy_unreachable(self):
+        """Nothing listening on the recorded ports is unhealthy"""
+        state = {
+            "executor_url": f"http://127.0.0.1:{free_port()}",
+            "debugger_address": f"127.0.0.1:{free_port()}",
+        }
+        assert not is_healthy(state, timeout=0.5)
+
+    def test_attach_without_daemon(self, daemon_files):
+        """No state file means no daemon to attach to"""
+        assert attach_to_daemon() is None
+
+    def test_attach_to_stale_state(self, daemon_files):
+        """State left by a dead daemon fails the health check"""
+        (daemon_files / "state.json").write_text(json.dumps({
+            "pid": 0,
+            "executor_url": f"http://127.0.0.1:{free_port()}",
+            "debugger_address": f"127.0.0.1:{free_port()}",
+        }))
+        assert attach_to_daemon() is None
+
+    def test_attach_while_lease_held(self, running_daemon):
+        """A second session is refused while the first holds the browser"""
+        driver = attach_to_daemon()
+        assert driver is not None
+        assert attach_to_daemon() is None
+        assert running_daemon == ["attach"]
+
+        release_from_daemon(driver)
+        assert active_leases() == []
+        assert attach_to_daemon() is not None
+
+    def test_attach_takes_over_stale_lease(self, running_daemon, daemon_files):
+        """A lease left by a run that died does not block the daemon forever"""
+        sessions = daemon_files / "sessions"
+        sessions.mkdir()
+        (sessions / browser_daemon.LEASE_NAME).write_text("")
+        old = time.time() - LEASE_MAX_AGE - 60
+        os.utime(sessions / browser_daemon.LEASE_NAME, (old, old))
+        assert attach_to_daemon() is not None
+        assert len(active_leases()) == 1
+
+    def test_release_resets_tab_before_quit(self, running_daemon):
+        """The next session starts without alerts, storage or the old page"""
+        release_from_daemon(attach_to_daemon())
+        assert running_daemon == [
+            "attach", "dismiss alert", "clear storage", "delete cookies",
+            "get about:blank", "quit",
+        ]
@@ -0,0 +1,99 @@
+import pytest
+from perf_budget import check_perf_budget, format_budget_row
+
+pytest_plugins = ["pytester"]
+
+
+class StubDriver:
+    """Returns fixed timings in place of a browser"""
+
+    def __init__(self, timings=None, measures=None):
+        self.collected = {"timings": timings or {}, "measures": measures or {}}
+
+    def execute_script(self, script):
+        return self.collected
+
+
+# Test module for the pytester runs: a stub driver fixture stands in for Chrome
+STUB_TESTS = """
+import pytest
+
+class StubDriver:
+    def execute_script(self, script):
+        return {"timings": {"dom_interactive": 120.0}, "measures": {"renderTodos": 40.0}}
+
+@pytest.fixture
+def driver():
+    return StubDriver()
+
+@pytest.mark.perf_budget(dom_interactive=500, measures={"renderTodos": 50})
+def test_within_budget(driver):
+    pass
+
+@pytest.mark.perf_budget(dom_interactive=100)
+def test_over_budget(driver):
+    pass
+
+@pytest.mark.perf_budget(first_contentful_paint=1000)
+def test_not_recorded(driver):
+    pass
+
+@pytest.mark.perf_budget(dom_interactive=500)
+def test_body_failure_skips_check(driver):
+    assert False
+"""
+
+
+class TestPerfBudget:
+    """Unit tests for perf_budget marker checks"""
+
+    def test_check_collects_timings_and_measures(self):
+        """Each budget becomes one (metric, actual, budget) row"""
+        driver = StubDriver({"dom_interactive": 120.0}, {"renderTodos": 40.0})
+        marker = pytest.mark.perf_budget(dom_interactive=500, measures={"renderTodos": 50}).mark
+        assert check_perf_budget(driver, marker) == [
+            ("dom_interactive", 120.0, 500),
+            ("measure:renderTodos", 40.0, 50),
+        ]
+
+    def test_check_reports_missing_metrics_as_none(self):
+        """Metrics the page never recorded have no actual value"""
+        marker = pytest.mark.perf_budget(load=100, measures={"importTodos": 10}).mark
+        assert check_perf_budget(StubDriver(), marker) == [
+            ("load", None, 100),
+            ("measure:importTodos", None, 10),
+        ]
+
+    def test_format_shows_headroom(self):
+        """Headroom is shown in ms and relative to the budget"""
+        assert format_budget_row("load", 75.0, 100) == \
+            "load: 75.0 ms / 100 ms (headroom +25.0 ms, +25%)"
+        assert format_budget_row("load", 150.0, 100) == \
+            "load: 150.0 ms / 100 ms (headroom -50.0 ms, -50%)"
+
+    def test_format_zero_budget(self):
+        """A 0 ms budget omits the relative headroom instead of dividing by zero"""
+        assert format_budget_row("load", 5.0, 0) == "load: 5.0 ms / 0 ms (headroom -5.0 ms)"
+
+    def test_format_not_recorded(self):
+        """Missing metrics are reported with their budget"""
+        assert format_budget_row("load", None, 100) == "load: not recorded (budget 100 ms)"
+
+    def test_marker_enforced_with_summary(self, pytester):
+        """Over-budget and unrecorded metrics fail; the summary lists headroom"""
+        pytester.makepyfile(STUB_TESTS)
+        result = pytester.runpytest("-p", "perf_budget")
+        result.assert_outcomes(passed=1, failed=3)
+        result.stdout.fnmatch_lines([
+            "*Performance budget exceeded:*",
+            "*= performance budgets =*",
+            "*test_within_budget",
+            "*dom_interactive: 120.0 ms / 500 ms (headroom +380.0 ms, +76%)",
+            "*measure:renderTodos: 40.0 ms / 50 ms (headroom +10.0 ms, +20%)",
+            "*test_over_budget",
+            "*dom_interactive: 120.0 ms / 100 ms (headroom -20.0 ms, -20%)",
+            "*test_not_recorded",
+            "*first_contentful_paint: not recorded (budget 1000 ms)",
+        ])
+        # a failing body is reported as-is, without a budget check
+        result.stdout.no_fnmatch_line("test_marker_enforced_with_summary.py::test_body_failure_skips_check")
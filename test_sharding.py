@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from sharding import (merge_durations, parse_shard, split_into_shards, shard_filename,
+                      shard_files)
+
+
+class TestSharding:
+    """Unit tests for --shard selection helpers"""
+
+    def test_parse_shard(self):
+        """Valid I/N values parse to integers"""
+        assert parse_shard("1/3") == (1, 3)
+        assert parse_shard("3/3") == (3, 3)
+
+    @pytest.mark.parametrize("value", ["0/3", "4/3", "1/0", "x/2", "1", "1/2/3"])
+    def test_parse_shard_rejects_invalid(self, value):
+        """Out-of-range or malformed values raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+    def test_split_without_history_is_round_robin(self):
+        """With no durations every test weighs the same"""
+        nodeids = [f"t{i}" for i in range(7)]
+        shards = split_into_shards(list(reversed(nodeids)), {}, 3)
+        assert shards == [["t0", "t3", "t6"], ["t1", "t4"], ["t2", "t5"]]
+
+    def test_split_balances_by_duration(self):
+        """The slow test gets a shard to itself"""
+        durations = {"slow": 10.0, "a": 1.0, "b": 1.0, "c": 1.0, "d": 1.0}
+        shards = split_into_shards(list(durations), durations, 2)
+        assert shards == [["slow"], ["a", "b", "c", "d"]]
+
+    def test_split_weights_unknown_tests_by_average(self):
+        """Tests without history count as the average recorded duration"""
+        durations = {"a": 4.0, "b": 2.0}
+        shards = split_into_shards(["a", "b", "new"], durations, 2)
+        assert shards == [["a"], ["new", "b"]]
+
+    def test_split_with_more_shards_than_tests(self):
+        """Extra shards are left empty rather than failing"""
+        assert split_into_shards(["a", "b"], {}, 4) == [["a"], ["b"], [], []]
+
+    def test_split_covers_every_test_once(self):
+        """Shards partition the collected tests"""
+        nodeids = [f"t{i}" for i in range(20)]
+        durations = {n: float(i % 5) for i, n in enumerate(nodeids)}
+        shards = split_into_shards(nodeids, durations, 4)
+        assert sorted(n for shard in shards for n in shard) == sorted(nodeids)
+
+    def test_shard_files_ignore_other_shard_counts(self, tmp_path):
+        """Leftover files from a run with a different N are not merged"""
+        for index, total in [(1, 2), (2, 2), (1, 3)]:
+            (tmp_path / shard_filename("test_results.csv", index, total)).write_text("")
+        found = [p.rsplit("/", 1)[-1] for p in shard_files(str(tmp_path), "test_results.csv", 2)]
+        assert found == ["test_results.shard-1-of-2.csv", "test_results.shard-2-of-2.csv"]
+
+    def test_merge_durations_with_custom_path(self, tmp_path):
+        """Shard files of a custom --durations-path are merged into that path"""
+        filename = "ci/durations.json"
+        (tmp_path / "ci").mkdir()
+        (tmp_path / filename).write_text(json.dumps({"old": 1.0, "a": 9.0}))
+        for index, durations in [(1, {"a": 2.0}), (2, {"b": 3.0})]:
+            path = tmp_path / shard_filename(filename, index, 2)
+            path.write_text(json.dumps(durations))
+
+        out_path = merge_durations(str(tmp_path), 2, filename)
+        assert out_path == str(tmp_path / filename)
+        with open(out_path, encoding='utf-8') as f:
+            assert json.load(f) == {"old": 1.0, "a": 2.0, "b": 3.0}
+        assert merge_durations(str(tmp_path), 2) is None
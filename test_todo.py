@@ -1,35 +1,43 @@
 import pytest
 import time
 import csv
+import json
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-# Test results storage
-test_results = []
+def import_through_ui(driver, path, timeout=120):
+    """Upload a file through the import control and collect timing data"""
+    # Record every main-thread task over 50 ms while the import runs
+    driver.execute_script("""
+        window.__longTasks = [];
+        new PerformanceObserver((list) => {
+            list.getEntries().forEach((e) => window.__longTasks.push(e.duration));
+        }).observe({ type: 'longtask' });
+    """)
+    driver.find_element(By.ID, "importFile").send_keys(str(path))
+    WebDriverWait(driver, timeout).until(
+        EC.text_to_be_present_in_element((By.ID, "transferStatus"), "Imported")
+    )
+    stats = driver.execute_script("return lastTransfer;")
+    long_tasks = driver.execute_script("return window.__longTasks;")
+    stats['longest_task_ms'] = max(long_tasks, default=0)
+    stats['blocking_ms'] = sum(d - 50 for d in long_tasks)
+    stats['rows_per_sec'] = stats['rows'] / (stats['ms'] / 1000)
+    return stats
 
-def log_test_result(test_id, description, test_type, expected, actual, status, remarks=""):
-    """Helper function to log test results"""
-    test_results.append({
-        'Test ID': test_id,
-        'Description': description,
-        'Type': test_type,
-        'Expected Result': expected,
-        'Actual Result': actual,
-        'Status': status,
-        'Remarks': remarks
-    })
 
 class TestTodoApplication:
     """Test suite for Todo List Application"""
     
     @pytest.fixture(autouse=True)
-    def setup_method(self, driver):
+    def setup_method(self, driver, log_test_result):
         """Setup before each test"""
         self.driver = driver
+        self.log_test_result = log_test_result
         self.driver.get("http://localhost:5500/index.html")  # Update this path
         self.wait = WebDriverWait(self.driver, 10)
         # Clear localStorage before each test
@@ -47,7 +55,7 @@ class TestTodoApplication:
             expected = "My Todo List"
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-01",
                 "Verify page title displays 'My Todo List'",
                 "Functional",
@@ -57,7 +65,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-01", "Verify page title", "Functional", 
+            self.log_test_result("TC-01", "Verify page title", "Functional", 
                           "My Todo List", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -77,7 +85,7 @@ class TestTodoApplication:
             expected = 1
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-02",
                 "Add a single task and verify it appears in the list",
                 "Functional",
@@ -87,7 +95,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-02", "Add single task", "Functional",
+            self.log_test_result("TC-02", "Add single task", "Functional",
                           "1 task displayed", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -105,7 +113,7 @@ class TestTodoApplication:
             expected = 1
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-03",
                 "Add task using Enter key",
                 "Functional",
@@ -115,7 +123,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-03", "Add task with Enter", "Functional",
+            self.log_test_result("TC-03", "Add task with Enter", "Functional",
                           "1 task added", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -136,7 +144,7 @@ class TestTodoApplication:
             expected = 3
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-04",
                 "Add multiple tasks (3 tasks)",
                 "Functional",
@@ -146,7 +154,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-04", "Add multiple tasks", "Functional",
+            self.log_test_result("TC-04", "Add multiple tasks", "Functional",
                           "3 tasks displayed", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -165,7 +173,7 @@ class TestTodoApplication:
             expected = "Please enter a task!"
             status = "PASS" if alert_text == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-05",
                 "Verify validation message for empty task",
                 "Validation",
@@ -175,7 +183,7 @@ class TestTodoApplication:
             )
             assert alert_text == expected
         except Exception as e:
-            log_test_result("TC-05", "Empty task validation", "Validation",
+            self.log_test_result("TC-05", "Empty task validation", "Validation",
                           "Alert displayed", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -201,7 +209,7 @@ class TestTodoApplication:
             actual = has_completed_class
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-06",
                 "Mark task as complete using checkbox",
                 "Functional",
@@ -211,7 +219,7 @@ class TestTodoApplication:
             )
             assert has_completed_class
         except Exception as e:
-            log_test_result("TC-06", "Mark task complete", "Functional",
+            self.log_test_result("TC-06", "Mark task complete", "Functional",
                           "Task completed", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -238,7 +246,7 @@ class TestTodoApplication:
             actual = has_completed_class
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-07",
                 "Unmark completed task",
                 "Functional",
@@ -248,7 +256,7 @@ class TestTodoApplication:
             )
             assert not has_completed_class
         except Exception as e:
-            log_test_result("TC-07", "Unmark task", "Functional",
+            self.log_test_result("TC-07", "Unmark task", "Functional",
                           "Task active", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -271,7 +279,7 @@ class TestTodoApplication:
             expected = 0
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-08",
                 "Delete a task using delete button",
                 "Functional",
@@ -281,7 +289,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-08", "Delete task", "Functional",
+            self.log_test_result("TC-08", "Delete task", "Functional",
                           "Task deleted", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -315,7 +323,7 @@ class TestTodoApplication:
             expected = 2
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-09",
                 "Filter: All - displays all tasks",
                 "Functional",
@@ -325,7 +333,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-09", "Filter All", "Functional",
+            self.log_test_result("TC-09", "Filter All", "Functional",
                           "All tasks shown", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -359,7 +367,7 @@ class TestTodoApplication:
             expected = 1
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-10",
                 "Filter: Active - displays only active tasks",
                 "Functional",
@@ -369,7 +377,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-10", "Filter Active", "Functional",
+            self.log_test_result("TC-10", "Filter Active", "Functional",
                           "Only active tasks", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -403,7 +411,7 @@ class TestTodoApplication:
             expected = 1
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-11",
                 "Filter: Completed - displays only completed tasks",
                 "Functional",
@@ -413,7 +421,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-11", "Filter Completed", "Functional",
+            self.log_test_result("TC-11", "Filter Completed", "Functional",
                           "Only completed tasks", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -451,7 +459,7 @@ class TestTodoApplication:
             expected = 1
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-12",
                 "Clear all completed tasks",
                 "Functional",
@@ -461,7 +469,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-12", "Clear completed", "Functional",
+            self.log_test_result("TC-12", "Clear completed", "Functional",
                           "Completed tasks cleared", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -490,7 +498,7 @@ class TestTodoApplication:
             expected = "1 active, 1 completed"
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-13",
                 "Verify task counter displays correct counts",
                 "Functional",
@@ -500,7 +508,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-13", "Task counter", "Functional",
+            self.log_test_result("TC-13", "Task counter", "Functional",
                           "Correct count", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -514,7 +522,7 @@ class TestTodoApplication:
             expected = "Enter a new task..."
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-14",
                 "Input field displays placeholder text",
                 "UI/UX",
@@ -524,7 +532,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-14", "Input placeholder", "UI/UX",
+            self.log_test_result("TC-14", "Input placeholder", "UI/UX",
                           "Placeholder visible", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -542,7 +550,7 @@ class TestTodoApplication:
             expected = ""
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-15",
                 "Input field clears after adding task",
                 "UI/UX",
@@ -552,7 +560,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-15", "Input clears", "UI/UX",
+            self.log_test_result("TC-15", "Input clears", "UI/UX",
                           "Field cleared", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -576,7 +584,7 @@ class TestTodoApplication:
             expected = 1
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-16",
                 "Tasks persist after page refresh",
                 "Regression",
@@ -586,7 +594,7 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-16", "Persistence test", "Regression",
+            self.log_test_result("TC-16", "Persistence test", "Regression",
                           "Task persisted", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -604,7 +612,7 @@ class TestTodoApplication:
             actual = task_text.text
             status = "PASS" if len(actual) <= 100 else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-17",
                 "Handle long task text (100 chars)",
                 "Boundary",
@@ -614,7 +622,7 @@ class TestTodoApplication:
             )
             assert len(actual) <= 100
         except Exception as e:
-            log_test_result("TC-17", "Long text", "Boundary",
+            self.log_test_result("TC-17", "Long text", "Boundary",
                           "Text handled", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -632,7 +640,7 @@ class TestTodoApplication:
             actual = task_text.text
             status = "PASS" if special_text in actual else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-18",
                 "Handle special characters in task text",
                 "Security",
@@ -642,7 +650,7 @@ class TestTodoApplication:
             )
             assert special_text in actual
         except Exception as e:
-            log_test_result("TC-18", "Special characters", "Security",
+            self.log_test_result("TC-18", "Special characters", "Security",
                           "Chars escaped", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -656,7 +664,7 @@ class TestTodoApplication:
             actual = is_displayed
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-19",
                 "Empty state message displays when no tasks",
                 "UI/UX",
@@ -666,7 +674,7 @@ class TestTodoApplication:
             )
             assert is_displayed
         except Exception as e:
-            log_test_result("TC-19", "Empty state", "UI/UX",
+            self.log_test_result("TC-19", "Empty state", "UI/UX",
                           "Message shown", str(e), "FAIL", str(e))
             pytest.fail(str(e))
     
@@ -687,7 +695,7 @@ class TestTodoApplication:
             expected = 5
             status = "PASS" if actual == expected else "FAIL"
             
-            log_test_result(
+            self.log_test_result(
                 "TC-20",
                 "Rapid task addition (5 tasks quickly)",
                 "Performance",
@@ -697,23 +705,495 @@ class TestTodoApplication:
             )
             assert actual == expected
         except Exception as e:
-            log_test_result("TC-20", "Rapid addition", "Performance",
+            self.log_test_result("TC-20", "Rapid addition", "Performance",
                           "5 tasks added", str(e), "FAIL", str(e))
             pytest.fail(str(e))
-
-
-# Pytest hooks to save results
-def pytest_sessionfinish(session, exitstatus):
-    """Save test results to CSV after all tests complete"""
-    if test_results:
-        with open('test_results.csv', 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['Test ID', 'Description', 'Type', 'Expected Result', 
-                         'Actual Result', 'Status', 'Remarks']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(test_results)
-        print(f"\n✓ Test results saved to test_results.csv")
-        print(f"Total tests: {len(test_results)}")
-        passed = sum(1 for r in test_results if r['Status'] == 'PASS')
-        failed = sum(1 for r in test_results if r['Status'] == 'FAIL')
-        print(f"Passed: {passed}, Failed: {failed}")
\ No newline at end of file
+    
+    def test_21_bulk_add_single_render(self):
+        """TC-21: Verify bulk add renders once instead of once per task"""
+        try:
+            input_field = self.driver.find_element(By.ID, "todoInput")
+            
+            # Baseline: 5 separate additions, one frame apart
+            self.driver.execute_script("renderCount = 0;")
+            for i in range(5):
+                input_field.send_keys(f"Single Task {i+1}")
+                input_field.send_keys(Keys.RETURN)
+                time.sleep(0.1)
+            time.sleep(0.2)
+            single_renders = self.driver.execute_script("return renderCount;")
+            
+            # Bulk: 5 tasks in one batch
+            self.driver.execute_script("renderCount = 0;")
+            self.driver.execute_script(
+                "addTodos(['Bulk 1', 'Bulk 2', 'Bulk 3', 'Bulk 4', 'Bulk 5']);"
+            )
+            time.sleep(0.2)
+            bulk_renders = self.driver.execute_script("return renderCount;")
+            
+            tasks = self.driver.find_elements(By.CLASS_NAME, "todo-item")
+            actual = (single_renders, bulk_renders, len(tasks))
+            expected = (5, 1, 10)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-21",
+                "Bulk add of 5 tasks triggers a single render",
+                "Performance",
+                "5 renders for single adds, 1 render for bulk add",
+                f"{single_renders} renders for single adds, {bulk_renders} render(s) for bulk add",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-21", "Bulk add render count", "Performance",
+                          "1 render for bulk add", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_22_toggle_all_single_render(self):
+        """TC-22: Verify toggle-all and same-frame toggles render once"""
+        try:
+            self.driver.execute_script(
+                "addTodos(Array.from({length: 20}, (_, i) => 'Task ' + (i + 1)));"
+            )
+            time.sleep(0.2)
+            
+            self.driver.execute_script("renderCount = 0;")
+            self.driver.execute_script("toggleAll(true);")
+            time.sleep(0.2)
+            toggle_all_renders = self.driver.execute_script("return renderCount;")
+            
+            # 20 individual toggles inside one frame are coalesced too
+            self.driver.execute_script("renderCount = 0;")
+            self.driver.execute_script("todos.forEach((t) => toggleTodo(t.id));")
+            time.sleep(0.2)
+            coalesced_renders = self.driver.execute_script("return renderCount;")
+            
+            completed = self.driver.find_elements(By.CSS_SELECTOR, ".todo-item.completed")
+            actual = (toggle_all_renders, coalesced_renders, len(completed))
+            expected = (1, 1, 0)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-22",
+                "Toggle-all and 20 same-frame toggles each render once",
+                "Performance",
+                "1 render per frame",
+                f"toggleAll: {toggle_all_renders}, 20 toggles: {coalesced_renders}",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-22", "Toggle-all render count", "Performance",
+                          "1 render per frame", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_23_sort_and_group_views(self):
+        """TC-23: Verify alphabetical sort and group-by-status views"""
+        try:
+            self.driver.execute_script("addTodos(['Banana', 'cherry', 'Apple']);")
+            time.sleep(0.3)
+            
+            # Complete 'Apple'
+            checkboxes = self.driver.find_elements(By.CLASS_NAME, "todo-checkbox")
+            checkboxes[2].click()
+            time.sleep(0.3)
+            
+            sort_select = Select(self.driver.find_element(By.ID, "sortSelect"))
+            sort_select.select_by_value("alpha")
+            time.sleep(0.3)
+            sorted_texts = [t.text for t in self.driver.find_elements(By.CLASS_NAME, "todo-text")]
+            
+            self.driver.find_element(By.ID, "groupByStatus").click()
+            time.sleep(0.3)
+            headers = [h.text for h in self.driver.find_elements(By.CLASS_NAME, "group-header")]
+            grouped_texts = [t.text for t in self.driver.find_elements(By.CLASS_NAME, "todo-text")]
+            
+            actual = (sorted_texts, headers, grouped_texts)
+            expected = (
+                ["Apple", "Banana", "cherry"],
+                ["Active (2)", "Completed (1)"],
+                ["Banana", "cherry", "Apple"],
+            )
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-23",
+                "Sort alphabetically, then group by status",
+                "Functional",
+                f"Sorted: {expected[0]}, grouped: {expected[2]}",
+                f"Sorted: {sorted_texts}, grouped: {grouped_texts}",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-23", "Sort and group views", "Functional",
+                          "Sorted and grouped", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_24_sorted_view_benchmark_50k(self):
+        """TC-24: Verify sorted views with 50k tasks cost less than re-sorting"""
+        try:
+            self.driver.execute_script(
+                "addTodos(Array.from({length: 50000}, (_, i) => 'Task ' + ((i * 7919) % 50000)));"
+            )
+            WebDriverWait(self.driver, 60).until(
+                EC.text_to_be_present_in_element((By.ID, "totalCount"), "50000")
+            )
+            
+            # Complete 100 tasks and show only those, so each render walks the
+            # whole 50k index but builds just 100 DOM items
+            upkeep_ms = self.driver.execute_script("""
+                const start = performance.now();
+                for (let i = 1; i <= 100; i++) toggleTodo(i);
+                return (performance.now() - start) / 100;
+            """)
+            self.driver.find_element(By.CSS_SELECTOR, "[data-filter='completed']").click()
+            time.sleep(0.3)
+            
+            sort_select = Select(self.driver.find_element(By.ID, "sortSelect"))
+            timings = {}
+            for key in ["created", "alpha", "status"]:
+                self.driver.execute_script(
+                    "renderCount = 0; performance.clearMeasures('renderTodos');"
+                )
+                sort_select.select_by_value(key)
+                WebDriverWait(self.driver, 10).until(
+                    lambda d: d.execute_script("return renderCount;") > 0
+                )
+                render_ms = self.driver.execute_script(
+                    "return performance.getEntriesByName('renderTodos')[0].duration;"
+                )
+                # What the same view costs without an index: sort a copy, then filter
+                resort_ms = self.driver.execute_script("""
+                    const key = arguments[0];
+                    const start = performance.now();
+                    todos.slice().sort(sortComparators[key]).filter((t) => t.completed);
+                    return performance.now() - start;
+                """, key)
+                timings[key] = (render_ms, resort_ms)
+            
+            # Every sorted render stays within budget, and the alphabetical view
+            # (the costliest comparator) beats re-sorting; near-sorted status
+            # and created orders are cheap for Array.sort, so they only get
+            # the budget
+            budget_ms = 50
+            shown = len(self.driver.find_elements(By.CLASS_NAME, "todo-item"))
+            within_budget = all(render < budget_ms for render, _ in timings.values())
+            alpha_faster = timings["alpha"][0] < timings["alpha"][1]
+            actual = (shown, within_budget, alpha_faster, upkeep_ms < 5)
+            expected = (100, True, True, True)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-24",
+                "Sorted views and index upkeep with 50k tasks",
+                "Performance",
+                f"Sorted renders under {budget_ms} ms, alphabetical faster than "
+                "re-sorting, toggle upkeep under 5 ms",
+                ", ".join(f"{k}: render {r:.1f} ms vs re-sort {rs:.1f} ms"
+                          for k, (r, rs) in timings.items())
+                + f", toggle: {upkeep_ms:.3f} ms",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-24", "Sorted view benchmark", "Performance",
+                          "Sorted views cheap at 50k", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_25_import_csv_100k(self, tmp_path):
+        """TC-25: Verify streaming CSV import of 100k rows keeps UI responsive"""
+        try:
+            path = tmp_path / "todos.csv"
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['text', 'completed', 'createdAt'])
+                for i in range(100000):
+                    writer.writerow([f"Imported, task {i}", "true" if i % 3 == 0 else "false", ""])
+            
+            stats = import_through_ui(self.driver, path)
+            total = self.driver.find_element(By.ID, "totalCount").text
+            completed = self.driver.find_element(By.ID, "completedCount").text
+            
+            budget_ms = 200
+            actual = (total, completed, stats['longest_task_ms'] < budget_ms)
+            expected = ("100000", "33334", True)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-25",
+                "Import 100k-row CSV file in chunks",
+                "Performance",
+                f"100000 tasks imported, no main-thread task over {budget_ms} ms",
+                f"{total} tasks, {stats['rows_per_sec']:.0f} rows/s, "
+                f"longest task {stats['longest_task_ms']:.0f} ms, "
+                f"blocking {stats['blocking_ms']:.0f} ms",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-25", "CSV import 100k", "Performance",
+                          "100000 tasks imported", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_26_import_json_100k(self, tmp_path):
+        """TC-26: Verify streaming JSON import of 100k rows keeps UI responsive"""
+        try:
+            path = tmp_path / "todos.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    [{"text": f"Task {{{i}}} \"quoted\"", "completed": i % 2 == 0}
+                     for i in range(100000)],
+                    f
+                )
+            
+            stats = import_through_ui(self.driver, path)
+            total = self.driver.find_element(By.ID, "totalCount").text
+            first_text = self.driver.find_element(By.CLASS_NAME, "todo-text").text
+            
+            budget_ms = 200
+            actual = (total, first_text, stats['longest_task_ms'] < budget_ms)
+            expected = ("100000", 'Task {0} "quoted"', True)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-26",
+                "Import 100k-row JSON file in chunks",
+                "Performance",
+                f"100000 tasks imported, no main-thread task over {budget_ms} ms",
+                f"{total} tasks, {stats['rows_per_sec']:.0f} rows/s, "
+                f"longest task {stats['longest_task_ms']:.0f} ms, "
+                f"blocking {stats['blocking_ms']:.0f} ms",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-26", "JSON import 100k", "Performance",
+                          "100000 tasks imported", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_27_export_round_trip(self):
+        """TC-27: Verify exported CSV and JSON contain every task"""
+        try:
+            self.driver.execute_script(
+                "addTodos(['Plain', 'With, comma', 'With \"quote\"']);"
+            )
+            time.sleep(0.3)
+            
+            exported = self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                Promise.all([exportTodos('csv'), exportTodos('json')])
+                    .then((blobs) => Promise.all(blobs.map((b) => b.text())))
+                    .then(done);
+            """)
+            csv_rows = list(csv.DictReader(exported[0].splitlines(keepends=True)))
+            json_rows = json.loads(exported[1])
+            
+            expected = ['Plain', 'With, comma', 'With "quote"']
+            actual = ([r['text'] for r in csv_rows], [r['text'] for r in json_rows])
+            status = "PASS" if actual == (expected, expected) else "FAIL"
+            
+            self.log_test_result(
+                "TC-27",
+                "Export tasks as CSV and JSON",
+                "Functional",
+                f"Both exports contain {expected}",
+                f"CSV: {actual[0]}, JSON: {actual[1]}",
+                status
+            )
+            assert actual == (expected, expected)
+        except Exception as e:
+            self.log_test_result("TC-27", "Export round trip", "Functional",
+                          "All tasks exported", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    @pytest.mark.perf_budget(
+        dom_interactive=1000,
+        first_contentful_paint=1500,
+        measures={"renderTodos": 1000}
+    )
+    def test_28_render_10k_within_budget(self, perf_budget_rows):
+        """TC-28: Verify page load and a 10k-task render stay within budget"""
+        # The app has no persistence, so the page cannot be loaded with 10k
+        # tasks already present: dom_interactive and first_contentful_paint
+        # cover loading the empty page, and the renderTodos span covers
+        # rendering the 10k tasks added afterwards
+        try:
+            self.driver.execute_script(
+                "addTodos(Array.from({length: 10000}, (_, i) => 'Task ' + (i + 1)));"
+            )
+            WebDriverWait(self.driver, 30).until(
+                EC.text_to_be_present_in_element((By.ID, "totalCount"), "10000")
+            )
+            
+            rows = perf_budget_rows()
+            over = [metric for metric, ms, budget in rows if ms is None or ms > budget]
+            status = "PASS" if not over else "FAIL"
+            
+            self.log_test_result(
+                "TC-28",
+                "Empty page load and 10k-task render within budget",
+                "Performance",
+                "; ".join(f"{metric} <= {budget} ms" for metric, _, budget in rows),
+                "; ".join(f"{metric}: {'not recorded' if ms is None else f'{ms:.0f} ms'}"
+                          for metric, ms, _ in rows),
+                status
+            )
+            assert not over
+        except Exception as e:
+            self.log_test_result("TC-28", "10k render budget", "Performance",
+                          "Within budget", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_29_import_normalizes_created_dates(self, tmp_path):
+        """TC-29: Verify imported numeric/invalid dates keep the sorted view consistent"""
+        try:
+            path = tmp_path / "dates.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump([
+                    {"text": "Epoch ms", "createdAt": 1700000000000},
+                    {"text": "Garbage", "createdAt": "not a date"},
+                    {"text": "ISO", "createdAt": "2024-01-01T00:00:00Z"},
+                    {"text": "Null", "createdAt": None},
+                    {"text": "Epoch string", "createdAt": "1600000000000"},
+                ], f)
+            import_through_ui(self.driver, path)
+            
+            Select(self.driver.find_element(By.ID, "sortSelect")).select_by_value("created")
+            time.sleep(0.3)
+            all_iso = self.driver.execute_script(
+                "return todos.every((t) => t.createdAt === new Date(t.createdAt).toISOString());"
+            )
+            
+            # Delete every task through the sorted view
+            for _ in range(5):
+                self.driver.find_element(By.CLASS_NAME, "delete-btn").click()
+                time.sleep(0.2)
+            
+            remaining = len(self.driver.find_elements(By.CLASS_NAME, "todo-item"))
+            index_sizes = self.driver.execute_script(
+                "return Object.values(sortIndexes).map((index) => index.length);"
+            )
+            actual = (all_iso, remaining, index_sizes)
+            expected = (True, 0, [0, 0, 0])
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-29",
+                "Import mixed createdAt values, then delete all under 'Newest first'",
+                "Regression",
+                "Dates normalized, no tasks left in view or indexes",
+                f"Dates ISO: {all_iso}, {remaining} task(s) shown, index sizes {index_sizes}",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-29", "Import date normalization", "Regression",
+                          "Indexes consistent", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_30_import_json_shapes(self, tmp_path):
+        """TC-30: Verify JSON import accepts string items and rejects other shapes"""
+        try:
+            strings = tmp_path / "strings.json"
+            strings.write_text('["First", "Second"]', encoding='utf-8')
+            import_through_ui(self.driver, strings)
+            total = self.driver.find_element(By.ID, "totalCount").text
+            
+            messages = []
+            for name, content in [("wrapped.json", '{"todos": [{"text": "a"}]}'),
+                                  ("numbers.json", '[1, 2]')]:
+                path = tmp_path / name
+                path.write_text(content, encoding='utf-8')
+                self.driver.execute_script("transferStatus.textContent = '';")
+                self.driver.find_element(By.ID, "importFile").send_keys(str(path))
+                WebDriverWait(self.driver, 10).until(
+                    EC.text_to_be_present_in_element((By.ID, "transferStatus"), "Import failed")
+                )
+                messages.append(self.driver.find_element(By.ID, "transferStatus").text)
+            
+            actual = (total, len(messages), self.driver.find_element(By.ID, "totalCount").text)
+            expected = ("2", 2, "2")
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-30",
+                "Import a string array; reject wrapped objects and primitives",
+                "Validation",
+                "2 tasks imported, 2 imports rejected",
+                f"{total} task(s) imported, rejected: {messages}",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-30", "Import JSON shapes", "Validation",
+                          "Invalid shapes rejected", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_31_failed_import_rolls_back(self, tmp_path):
+        """TC-31: Verify an import failing midway keeps none of its rows"""
+        try:
+            self.driver.execute_script("addTodos(['Existing task']);")
+            time.sleep(0.3)
+            
+            # 5000 valid items span several stream chunks before the bad token
+            path = tmp_path / "broken.json"
+            items = ",".join(json.dumps({"text": f"Task {i}"}) for i in range(5000))
+            path.write_text(f"[{items}, oops]", encoding='utf-8')
+            self.driver.find_element(By.ID, "importFile").send_keys(str(path))
+            WebDriverWait(self.driver, 30).until(
+                EC.text_to_be_present_in_element((By.ID, "transferStatus"), "Import failed")
+            )
+            time.sleep(0.3)
+            
+            total = self.driver.find_element(By.ID, "totalCount").text
+            shown = len(self.driver.find_elements(By.CLASS_NAME, "todo-item"))
+            progress_visible = self.driver.find_element(By.ID, "transferProgress").is_displayed()
+            actual = (total, shown, progress_visible)
+            expected = ("1", 1, False)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-31",
+                "Import failing partway through a JSON file is rolled back",
+                "Regression",
+                "Only the existing task remains, progress bar hidden",
+                f"Total: {total}, shown: {shown}, progress visible: {progress_visible}",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-31", "Failed import rollback", "Regression",
+                          "No partial import", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
+    
+    def test_32_import_hidden_by_filter_keeps_empty_state(self, tmp_path):
+        """TC-32: Verify importing only active tasks under 'Completed' keeps the empty message"""
+        try:
+            self.driver.find_element(By.CSS_SELECTOR, "[data-filter='completed']").click()
+            time.sleep(0.3)
+            
+            path = tmp_path / "active.json"
+            path.write_text('["Active one", "Active two"]', encoding='utf-8')
+            import_through_ui(self.driver, path)
+            
+            empty_shown = len(self.driver.find_elements(By.CLASS_NAME, "empty-state")) == 1
+            total = self.driver.find_element(By.ID, "totalCount").text
+            actual = (total, empty_shown)
+            expected = ("2", True)
+            status = "PASS" if actual == expected else "FAIL"
+            
+            self.log_test_result(
+                "TC-32",
+                "Empty state stays when no imported task matches the filter",
+                "UI/UX",
+                "2 tasks imported, empty message still shown",
+                f"{total} task(s) imported, empty message shown: {empty_shown}",
+                status
+            )
+            assert actual == expected
+        except Exception as e:
+            self.log_test_result("TC-32", "Empty state after filtered import", "UI/UX",
+                          "Empty message shown", str(e), "FAIL", str(e))
+            pytest.fail(str(e))
\ No newline at end of file